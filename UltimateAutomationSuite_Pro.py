@@ -9,20 +9,9 @@ import requests
 import pyqtgraph as pg
 import numpy as np
 from PyQt5 import QtWidgets, QtCore, QtGui
-from PyQt5.QtWebEngineWidgets import QWebEngineView
 from PyQt5.QtMultimedia import QSound
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.proxy import Proxy, ProxyType
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from sklearn.ensemble import RandomForestClassifier
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import Dense
 from cryptography.fernet import Fernet
 from concurrent.futures import ThreadPoolExecutor
-from web3 import Web3
 from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
                              QGroupBox, QFormLayout, QTextEdit, QLabel,
                              QPushButton, QProgressBar, QTabWidget, QLineEdit,
@@ -31,17 +20,377 @@ import logging
 import threading
 import queue
 import os
+import shutil
+import itertools
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# ==================== Persistent Audit Log ====================
+AUDIT_LOG_FILE = "audit_log.jsonl"
+AUDIT_KEY_FILE = "audit.key"
+AUDIT_BATCH_SIZE = 64
+AUDIT_FLUSH_INTERVAL = 1.0
+AUDIT_CHECKPOINT_EVERY = 64
+GENESIS_HASH = "0" * 64
+
+def sha256_hex(text):
+    return hashlib.sha256(text.encode()).hexdigest()
+
+def load_or_create_key(path=AUDIT_KEY_FILE):
+    # The audit key has to outlive the process, otherwise the log can never be read back.
+    try:
+        with open(path, "rb") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        key = Fernet.generate_key()
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(key)
+        return key
+
+def merkle_root(hashes):
+    level = list(hashes) or [GENESIS_HASH]
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [sha256_hex(level[i] + level[i + 1]) for i in range(0, len(level), 2)]
+    return level[0]
+
+class AuditLog:
+    """Append-only, hash-chained audit log stored as JSON lines.
+
+    Callers only enqueue entries; a background thread groups them into
+    batches, encrypts each batch as one Fernet token and appends a record
+    whose hash covers the previous record's hash. Every
+    AUDIT_CHECKPOINT_EVERY records a checkpoint line holds the Merkle root of
+    the record hashes since the last one. Verification progress is saved at
+    each checkpoint, so verify() only rehashes records written since then.
+
+    The log is checked on the writer thread before the first write. A torn
+    final line (no newline, or unparseable) is the only thing ever cut: a
+    copy is kept as ``<path>.damaged-<timestamp>[.n]`` and the file is
+    truncated back to the last valid record. A real chain or checkpoint
+    mismatch leaves the file untouched. Writing then continues in a new
+    ``<path>.segment-<n>`` file that starts with a ``segment`` header naming
+    the broken file, and verify() keeps returning False.
+    """
+
+    _STOP = object()
+
+    def __init__(self, cipher, path=AUDIT_LOG_FILE, batch_size=AUDIT_BATCH_SIZE,
+                 flush_interval=AUDIT_FLUSH_INTERVAL, checkpoint_every=AUDIT_CHECKPOINT_EVERY):
+        self.cipher = cipher
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.checkpoint_every = checkpoint_every
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._write_path = path
+        self._head, self._seq, self._pending = GENESIS_HASH, 0, []
+        self._thread = threading.Thread(target=self._writer, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def append(self, entry):
+        self._queue.put(entry)
+
+    def close(self):
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+    def segments(self):
+        paths = [self.path]
+        for n in itertools.count(1):
+            segment = f"{self.path}.segment-{n}"
+            if not os.path.exists(segment):
+                return paths
+            paths.append(segment)
+
+    def verify(self):
+        with self._lock:
+            previous = None
+            for path in self.segments():
+                status, head, seq, _, _, header = self._scan(path)
+                if status != "ok":
+                    return False
+                if header != (previous[1:] if previous else None):
+                    logger.error(f"Audit segment {path} does not continue from the previous segment.")
+                    return False
+                previous = (status, head, seq)
+            return True
+
+    def entries(self):
+        """Yields every readable logged entry, decrypting batch by batch."""
+        with self._lock:
+            records = []
+            for path in self.segments():
+                with open(path, "rb") as f:
+                    for raw in f:
+                        try:
+                            records.append(json.loads(raw))
+                        except ValueError:
+                            continue
+        for record in records:
+            if isinstance(record, dict) and record.get("type") == "batch":
+                yield from json.loads(self.cipher.decrypt(record["data"].encode()))
+
+    # ---- writer thread ----
+    def _recover(self):
+        with self._lock:
+            paths = self.segments()
+            previous = None
+            for path in paths:
+                status, head, seq, pending, valid_offset, _ = self._scan(path)
+                previous = (path, status, head, seq, pending, valid_offset)
+            path, status, head, seq, pending, valid_offset = previous
+            if status == "torn":
+                damaged = self._unique_copy(path, f"{path}.damaged-{time.strftime('%Y%m%d-%H%M%S')}")
+                with open(path, "r+b") as f:
+                    f.truncate(valid_offset)
+                logger.error(f"Audit log {path} ended in a torn write; kept a copy at {damaged} "
+                             f"and dropped the partial line.")
+            elif status == "tampered":
+                broken = path
+                path = f"{self.path}.segment-{len(paths)}"
+                with open(path, "x") as f:
+                    f.write(json.dumps({"type": "segment", "follows": broken, "reason": "verification failed",
+                                        "head": head, "seq": seq}) + "\n")
+                pending = []
+                logger.error(f"Audit log {broken} failed verification and was left untouched; "
+                             f"new entries go to {path}.")
+            self._write_path = path
+            self._head, self._seq, self._pending = head, seq, pending
+
+    @staticmethod
+    def _unique_copy(src, target):
+        for n in itertools.count():
+            candidate = target if n == 0 else f"{target}.{n}"
+            try:
+                fd = os.open(candidate, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            except FileExistsError:
+                continue
+            with os.fdopen(fd, "wb") as dst, open(src, "rb") as source:
+                shutil.copyfileobj(source, dst)
+            return candidate
+
+    def _writer(self):
+        try:
+            self._recover()
+        except Exception as e:
+            logger.error(f"Audit log recovery failed: {e}")
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is self._STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                logger.error(f"Audit log write failed: {e}")
+
+    def _write_batch(self, entries):
+        token = self.cipher.encrypt(json.dumps(entries).encode()).decode()
+        with self._lock:
+            record_hash = sha256_hex(self._head + token)
+            seq = self._seq + 1
+            pending = self._pending + [record_hash]
+            lines = [json.dumps({"type": "batch", "seq": self._seq, "count": len(entries),
+                                 "prev": self._head, "hash": record_hash, "data": token})]
+            if len(pending) >= self.checkpoint_every:
+                lines.append(json.dumps({"type": "checkpoint", "seq": seq,
+                                         "head": record_hash, "root": merkle_root(pending)}))
+                pending = []
+            with open(self._write_path, "a") as f:
+                f.write("\n".join(lines) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            # Only advance the chain once the records are on disk.
+            self._head, self._seq, self._pending = record_hash, seq, pending
+
+    # ---- verification ----
+    @staticmethod
+    def _load_progress(path):
+        try:
+            with open(path + ".verified") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _scan(self, path):
+        """Checks one segment, resuming at its last verified checkpoint.
+
+        Returns ``(status, head, seq, hashes since last checkpoint,
+        end offset of the last valid record, (header head, header seq) or None)``
+        where status is "ok", "torn" (only the final line is damaged) or "tampered".
+        """
+        try:
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            size = 0
+        start = {"offset": 0, "head": GENESIS_HASH, "seq": 0, "header": None}
+        progress = self._load_progress(path)
+        if not progress or progress["offset"] > size:
+            progress = start
+        offset, head, seq = progress["offset"], progress["head"], progress["seq"]
+        header = tuple(progress["header"]) if progress.get("header") else None
+        pending = []
+        saved = dict(progress)
+        status = "ok"
+        if not size:
+            return status, head, seq, pending, 0, header
+        with open(path, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                last_line = offset + len(raw) == size
+                try:
+                    if not raw.endswith(b"\n"):
+                        raise json.JSONDecodeError("missing newline", raw.decode(errors="replace"), len(raw))
+                    record = json.loads(raw)
+                    if record["type"] == "segment" and offset == 0:
+                        head, seq = record["head"], record["seq"]
+                        header = (head, seq)
+                    elif record["type"] == "batch":
+                        expected = sha256_hex(head + record["data"])
+                        if record["seq"] != seq or record["prev"] != head or record["hash"] != expected:
+                            raise ValueError(f"chain broken at record {seq}")
+                        head = expected
+                        seq += 1
+                        pending.append(head)
+                    elif record["type"] == "checkpoint":
+                        if record["seq"] != seq or record["head"] != head or record["root"] != merkle_root(pending):
+                            raise ValueError(f"checkpoint mismatch at record {seq}")
+                        pending = []
+                        saved = {"offset": offset + len(raw), "head": head, "seq": seq, "header": header}
+                    else:
+                        raise ValueError(f"unexpected {record['type']!r} line after record {seq}")
+                except json.JSONDecodeError as e:
+                    status = "torn" if last_line else "tampered"
+                    logger.error(f"Audit log {path}: unreadable line after record {seq}: {e}")
+                    break
+                except (ValueError, KeyError, TypeError) as e:
+                    status = "tampered"
+                    logger.error(f"Audit log {path} verification failed: {e}")
+                    break
+                offset += len(raw)
+        if saved != progress:
+            with open(path + ".verified", "w") as pf:
+                json.dump(saved, pf)
+        return status, head, seq, pending, offset, header
+
+# ==================== Telemetry History ====================
+# (bucket seconds, capacity) per tier: 1 h at 1 s, 1 week at 1 min, 1 year at 1 h.
+TELEMETRY_TIERS = [(1, 3600), (60, 7 * 24 * 60), (3600, 365 * 24)]
+TELEMETRY_VIEW_SECONDS = 300
+
+class RingBuffer:
+    """Fixed-capacity NumPy ring buffer of float rows."""
+
+    def __init__(self, capacity, width):
+        self.data = np.zeros((capacity, width))
+        self.capacity = capacity
+        self.count = 0
+
+    def append(self, row):
+        self.data[self.count % self.capacity] = row
+        self.count += 1
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def rows(self):
+        # Oldest first.
+        if self.count <= self.capacity:
+            return self.data[:self.count]
+        split = self.count % self.capacity
+        return np.concatenate((self.data[split:], self.data[:split]))
+
+class TelemetryHistory:
+    """Multi-resolution history for a fixed set of series.
+
+    The finest tier stores raw ``[t, v1, v2, ...]`` samples. Coarser tiers
+    store one ``[t, min1, max1, min2, max2, ...]`` row per bucket, so peaks
+    survive downsampling. Memory is fixed by TELEMETRY_TIERS no matter how
+    long the dashboard runs.
+    """
+
+    def __init__(self, n_series, tiers=TELEMETRY_TIERS):
+        self.n_series = n_series
+        self.raw = RingBuffer(tiers[0][1], 1 + n_series)
+        self.tiers = [(bucket, RingBuffer(capacity, 1 + 2 * n_series)) for bucket, capacity in tiers[1:]]
+        self._open = [None] * len(self.tiers)  # [bucket_start, mins, maxs] being filled per tier
+        self.first_t = None
+
+    def add(self, t, *values):
+        values = np.asarray(values, dtype=float)
+        if self.first_t is None:
+            self.first_t = t
+        self.raw.append(np.concatenate(([t], values)))
+        for i, (bucket, ring) in enumerate(self.tiers):
+            start = t - t % bucket
+            current = self._open[i]
+            if current is not None and current[0] != start:
+                ring.append(self._bucket_row(current))
+                current = None
+            if current is None:
+                self._open[i] = [start, values.copy(), values.copy()]
+            else:
+                np.minimum(current[1], values, out=current[1])
+                np.maximum(current[2], values, out=current[2])
+
+    @staticmethod
+    def _bucket_row(bucket):
+        start, mins, maxs = bucket
+        return np.concatenate(([start], np.column_stack((mins, maxs)).ravel()))
+
+    def _tier_rows(self, i):
+        # Closed buckets plus the one still being filled, so the newest data is always visible.
+        rows = self.tiers[i][1].rows()
+        if self._open[i] is not None:
+            rows = np.vstack((rows, self._bucket_row(self._open[i])))
+        return rows
+
+    def window(self, t0, t1):
+        """Returns ``(x, [y per series])`` for the finest tier that still covers ``t0``."""
+        if self.first_t is not None:
+            # A view starting before the first sample only needs the tiers to reach back that far.
+            t0 = max(t0, self.first_t)
+        rows = self.raw.rows()
+        if len(rows) and (rows[0, 0] <= t0 or not self.tiers[0][1].count):
+            return self._slice(rows, t0, t1, peak=False)
+        for i in range(len(self.tiers)):
+            rows = self._tier_rows(i)
+            if i == len(self.tiers) - 1 or (len(rows) and rows[0, 0] <= t0):
+                return self._slice(rows, t0, t1, peak=True)
+        return np.empty(0), [np.empty(0)] * self.n_series
+
+    def _slice(self, rows, t0, t1, peak):
+        lo, hi = np.searchsorted(rows[:, 0], [t0, t1], side="left")
+        rows = rows[max(lo - 1, 0):hi + 1]
+        if not peak:
+            return rows[:, 0], [rows[:, 1 + k] for k in range(self.n_series)]
+        # Emit each bucket's min then max at the same x so the curve spans the full range.
+        x = np.repeat(rows[:, 0], 2)
+        return x, [rows[:, 1 + 2 * k:3 + 2 * k].ravel() for k in range(self.n_series)]
+
 # ==================== Enhanced Security Manager ====================
 class EnhancedSecurityManager:
-    def __init__(self, encryption_key):
+    def __init__(self, encryption_key, audit_path=AUDIT_LOG_FILE):
         self.cipher = Fernet(encryption_key)
-        self.w3 = None  # Web3(Web3.HTTPProvider('https://mainnet.infura.io/v3/YOUR_INFURA_ID'))
-        self.audit_chain = []
+        self.w3 = None  # web3 is not imported until this is actually wired up
+        self.audit_log = AuditLog(self.cipher, audit_path)
 
     def encrypt_data(self, data):
         try:
@@ -58,24 +407,26 @@ class EnhancedSecurityManager:
             return None
 
     def secure_log(self, data):
-        encrypted = self.encrypt_data(json.dumps(data))
-        if encrypted is None:
-            logger.error("Encryption failed, data not logged.")
-            return
-        self.audit_chain.append({
-            'timestamp': time.time(),
-            'data_hash': hashlib.sha256(encrypted).hexdigest()
-        })
+        # Encryption and the disk write happen on the audit writer thread.
+        self.audit_log.append({'timestamp': time.time(), 'data': data})
         logger.info(f"Data logged: {data['action']}")
 
+    def close(self):
+        self.audit_log.close()
+
 # ==================== AI Orchestrator ====================
 class AIOrchestratorPro:
+    # TensorFlow and scikit-learn are imported here rather than at module load;
+    # together they cost seconds and hundreds of MB before the window appears.
     def __init__(self):
+        from sklearn.ensemble import RandomForestClassifier
         self.nn_model = self.build_neural_network()
         self.rf_model = RandomForestClassifier(n_estimators=150)
         self.load_pretrained()
 
     def build_neural_network(self):
+        from tensorflow.keras.models import Sequential
+        from tensorflow.keras.layers import Dense
         model = Sequential([
             Dense(256, activation='relu', input_shape=(12,)),
             Dense(128, activation='relu'),
@@ -171,6 +522,8 @@ class SmartBrowserCluster:
         self.init_cluster(num_instances)
 
     def init_cluster(self, num_instances):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
         try:
             for _ in range(num_instances):
                 service = Service(log_output=os.devnull)  # إصلاح: استخدام Service بدلاً من service_log_path
@@ -192,6 +545,7 @@ class SmartBrowserCluster:
                 self.log_area.append(f"Error initializing browsers: {e}")
 
     def get_browser_options(self):
+        from selenium import webdriver
         options = webdriver.ChromeOptions()
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
@@ -200,6 +554,7 @@ class SmartBrowserCluster:
         return options
 
     def execute_task(self, browser, url, clicks):
+        from selenium.webdriver.common.by import By
         try:
             browser['status'] = 'busy'
             driver = browser['driver']
@@ -228,8 +583,10 @@ class UltimateAutomationSuite(QtWidgets.QMainWindow):
         self.setup_custom_style()
         
         # Initialize core systems
-        self.security = EnhancedSecurityManager(Fernet.generate_key())
-        self.ai_engine = AIOrchestratorPro()
+        self.security = EnhancedSecurityManager(load_or_create_key())
+        self._ai_engine = None  # built on first use, see ai_engine
+        self._ai_engine_lock = threading.Lock()
+        self.web_view = None  # created when the Web View tab is first opened
         self.browser_cluster = None  # إصلاح: تأخير تهيئة browser_cluster
         self.task_manager = ThreadPoolExecutor(max_workers=20)
         self.is_running = False
@@ -237,14 +594,21 @@ class UltimateAutomationSuite(QtWidgets.QMainWindow):
         self.task_thread = None
         self.completed_clicks = 0
         self.failures = 0
-        self.cpu_data = []  # إصلاح: تخزين بيانات الأداء
-        self.mem_data = []
-        self.time_data = []
+        self.telemetry = TelemetryHistory(n_series=2)  # CPU, memory
+        self.telemetry_start = time.monotonic()
+        self.follow_latest = True
         
         self.init_ui()
         self.setup_connections()
         self.start_performance_monitor()
 
+    @property
+    def ai_engine(self):
+        with self._ai_engine_lock:
+            if self._ai_engine is None:
+                self._ai_engine = AIOrchestratorPro()
+            return self._ai_engine
+
     def setup_custom_style(self):
         self.setStyleSheet("""
             QMainWindow {
@@ -298,11 +662,12 @@ class UltimateAutomationSuite(QtWidgets.QMainWindow):
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
         
-        tabs = QTabWidget()
-        tabs.addTab(self.create_control_panel(), "Main Control")
-        tabs.addTab(self.create_analytics_panel(), "Advanced Analytics")
-        tabs.addTab(self.create_web_view_panel(), "Web View")
-        main_layout.addWidget(tabs)
+        self.tabs = QTabWidget()
+        self.tabs.addTab(self.create_control_panel(), "Main Control")
+        self.tabs.addTab(self.create_analytics_panel(), "Advanced Analytics")
+        self.web_view_tab = self.tabs.addTab(self.create_web_view_panel(), "Web View")
+        self.tabs.currentChanged.connect(self.on_tab_changed)
+        main_layout.addWidget(self.tabs)
 
     def create_control_panel(self):
         tab = QWidget()
@@ -355,6 +720,10 @@ class UltimateAutomationSuite(QtWidgets.QMainWindow):
         
         self.performance_plot = pg.PlotWidget(title="System Performance Over Time")
         self.performance_plot.addLegend()
+        self.performance_plot.setClipToView(True)
+        self.performance_plot.setDownsampling(auto=True, mode='peak')
+        self.performance_plot.setLabel('bottom', "Time", units='s')
+        self.performance_plot.getViewBox().sigRangeChangedManually.connect(self.on_plot_range_changed)
         self.cpu_curve = self.performance_plot.plot(pen='#4CAF50', name="CPU Usage")
         self.mem_curve = self.performance_plot.plot(pen='#2196F3', name="Memory Usage")
         
@@ -383,13 +752,23 @@ class UltimateAutomationSuite(QtWidgets.QMainWindow):
 
     def create_web_view_panel(self):
         tab = QWidget()
-        layout = QVBoxLayout()
-        self.web_view = QWebEngineView()
-        self.web_view.load(QtCore.QUrl("https://www.example.com"))
-        layout.addWidget(self.web_view)
-        tab.setLayout(layout)
+        self.web_view_layout = QVBoxLayout()
+        tab.setLayout(self.web_view_layout)
         return tab
 
+    def ensure_web_view(self):
+        # QtWebEngine spins up a Chromium process; only pay for it once the tab is used.
+        if self.web_view is None:
+            from PyQt5.QtWebEngineWidgets import QWebEngineView
+            self.web_view = QWebEngineView()
+            self.web_view.load(QtCore.QUrl("https://www.example.com"))
+            self.web_view_layout.addWidget(self.web_view)
+        return self.web_view
+
+    def on_tab_changed(self, index):
+        if index == self.web_view_tab:
+            self.ensure_web_view()
+
     def create_proxy_controls(self):
         container = QWidget()
         layout = QHBoxLayout()
@@ -442,7 +821,7 @@ class UltimateAutomationSuite(QtWidgets.QMainWindow):
         url = self.url_input.text()
         if url:
             try:
-                self.web_view.load(QtCore.QUrl(url))
+                self.ensure_web_view().load(QtCore.QUrl(url))
                 self.log_area.append(f"Web view updated to {url}")
             except Exception as e:
                 logger.error(f"Failed to update web view: {e}")
@@ -555,15 +934,23 @@ class UltimateAutomationSuite(QtWidgets.QMainWindow):
         self.lbl_success_rate.setText(f"{success_rate:.2f}%")
         self.lbl_failures.setText(str(self.failures))
         
-        cpu_usage = psutil.cpu_percent()
-        mem_usage = psutil.virtual_memory().percent
-        self.time_data.append(len(self.time_data))
-        self.cpu_data.append(cpu_usage)
-        self.mem_data.append(mem_usage)
+        now = int(time.monotonic() - self.telemetry_start)
+        self.telemetry.add(now, psutil.cpu_percent(), psutil.virtual_memory().percent)
         
-        # إصلاح: تحديث الرسم البياني ببيانات الزمن
-        self.cpu_curve.setData(self.time_data, self.cpu_data)
-        self.mem_curve.setData(self.time_data, self.mem_data)
+        # Only the visible window is handed to the plot, so redraw cost doesn't grow with uptime.
+        view_box = self.performance_plot.getViewBox()
+        if view_box.autoRangeEnabled()[0]:
+            self.follow_latest = True
+        if self.follow_latest:
+            self.performance_plot.setXRange(max(0, now - TELEMETRY_VIEW_SECONDS), now, padding=0)
+        t0, t1 = view_box.viewRange()[0]
+        x, (cpu, mem) = self.telemetry.window(t0, t1)
+        self.cpu_curve.setData(x, cpu)
+        self.mem_curve.setData(x, mem)
+
+    def on_plot_range_changed(self, *args):
+        # The user panned or zoomed; stop snapping back to the latest samples until autorange is pressed.
+        self.follow_latest = False
 
     def start_performance_monitor(self):
         self.log_area.append("Performance monitoring started.")
@@ -590,9 +977,12 @@ class UltimateAutomationSuite(QtWidgets.QMainWindow):
                     self.log_area.append(f"Error closing browser: {e}")
             self.browser_cluster.browsers.clear()
         self.task_manager.shutdown(wait=True)
+        self.security.close()
         event.accept()
 
 if __name__ == "__main__":
+    # Lets QtWebEngineWidgets be imported after the QApplication exists.
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     window = UltimateAutomationSuite()
     window.show()
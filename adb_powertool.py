@@ -1,72 +1,15 @@
-import os
-import subprocess
 import argparse
 import getpass
-import json
 import sys
 import time
 from tabulate import tabulate
-from datetime import datetime
 
-CONFIG_FILE = "config.json"
-LOG_FILE = "logs.txt"
+from adbcore import (adb, check_adb_connection, send_ussd, capture_screenshot,
+                     start_screen_record, stop_screen_record, input_text, tap,
+                     load_config, save_config, reset_config, log_action, show_logs,
+                     send_transfer)
 
 
-# ------------------------ ADB FUNCTIONS ------------------------
-def adb(command):
-    try:
-        result = subprocess.check_output(f"adb {command}", shell=True, stderr=subprocess.DEVNULL)
-        return result.decode().strip()
-    except subprocess.CalledProcessError:
-        return ""
-
-def check_adb_connection():
-    while True:
-        devices = adb("devices").splitlines()[1:]
-        if devices and any("device" in d for d in devices):
-            return True
-        print("\nTrying to reconnect ADB...")
-        time.sleep(2)
-
-def send_ussd(code):
-    adb(f"shell am start -a android.intent.action.CALL -d tel:{code.replace('#', '%23')}")
-
-
-def capture_screenshot():
-    adb("shell screencap -p /sdcard/screen.png")
-    adb("pull /sdcard/screen.png screen.png")
-    return "screen.png"
-
-def start_screen_record():
-    adb("shell screenrecord /sdcard/record.mp4 &")
-
-def stop_screen_record():
-    adb("shell killall -9 screenrecord")
-    adb("pull /sdcard/record.mp4 record.mp4")
-
-
-def input_text(text):
-    adb(f"shell input text '{text}'")
-
-def tap(x, y):
-    adb(f"shell input tap {x} {y}")
-
-# ------------------------ CONFIG ------------------------
-def load_config():
-    if not os.path.exists(CONFIG_FILE):
-        return {}
-    with open(CONFIG_FILE) as f:
-        return json.load(f)
-
-def save_config(config):
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
-
-def reset_config():
-    if os.path.exists(CONFIG_FILE):
-        os.remove(CONFIG_FILE)
-    print("✅ Config reset.")
-
 # ------------------------ PASSWORD ------------------------
 def set_password():
     pw = getpass.getpass("🔐 Set new password: ")
@@ -86,21 +29,6 @@ def verify_password(stored_pw):
         return False
     return True
 
-# ------------------------ LOGGING ------------------------
-def log_action(action):
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(LOG_FILE, "a") as f:
-        f.write(f"[{now}] {action}\n")
-
-def show_logs():
-    if not os.path.exists(LOG_FILE):
-        print("📂 No logs found.")
-        return
-    with open(LOG_FILE) as f:
-        logs = f.readlines()
-    print("\n📜 Logs:")
-    print("".join(logs))
-
 # ------------------------ TELECOM FEATURES (EGYPT) ------------------------
 
 PROVIDERS = {
@@ -165,7 +93,7 @@ PROVIDERS = {
 def send_ussd_transfer(number, amount, pin, provider):
     code = PROVIDERS[provider]["transfer"].format(number=number, amount=amount, pin=pin)
     print(f"📤 Sending USSD: {code}")
-    send_ussd(code)
+    send_transfer(code, provider)
     log_action(f"Transfer: {amount} to {number} [{provider}]")
 
 def check_balance(provider):
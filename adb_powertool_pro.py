@@ -1,5 +1,4 @@
 import os
-import subprocess
 import argparse
 import getpass
 import json
@@ -7,64 +6,21 @@ import sys
 import time
 import re
 import hashlib
-from tabulate import tabulate
+import wave
+import threading
+import cProfile
+import pstats
+import tracemalloc
+from collections import Counter
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from tabulate import tabulate
 
-CONFIG_FILE = "config.json"
-LOG_FILE = "logs.txt"
-
-# ------------------------ ADB FUNCTIONS ------------------------
-def adb(command):
-    try:
-        result = subprocess.check_output(f"adb {command}", shell=True, stderr=subprocess.DEVNULL)
-        return result.decode().strip()
-    except subprocess.CalledProcessError:
-        return ""
-
-def check_adb_connection():
-    while True:
-        devices = adb("devices").splitlines()[1:]
-        if devices and any("device" in d for d in devices):
-            return True
-        print("\nTrying to reconnect ADB...")
-        time.sleep(2)
-
-def send_ussd(code):
-    adb(f"shell am start -a android.intent.action.CALL -d tel:{code.replace('#', '%23')}")
-
-def capture_screenshot():
-    adb("shell screencap -p /sdcard/screen.png")
-    adb("pull /sdcard/screen.png screen.png")
-    return "screen.png"
-
-def start_screen_record():
-    adb("shell screenrecord /sdcard/record.mp4 &")
-
-def stop_screen_record():
-    adb("shell killall -9 screenrecord")
-    adb("pull /sdcard/record.mp4 record.mp4")
-
-def input_text(text):
-    adb(f"shell input text '{text}'")
-
-def tap(x, y):
-    adb(f"shell input tap {x} {y}")
-
-# ------------------------ CONFIG ------------------------
-def load_config():
-    if not os.path.exists(CONFIG_FILE):
-        return {}
-    with open(CONFIG_FILE) as f:
-        return json.load(f)
-
-def save_config(config):
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
-
-def reset_config():
-    if os.path.exists(CONFIG_FILE):
-        os.remove(CONFIG_FILE)
-    print("✅ Config reset.")
+from adbcore import (adb, check_adb_connection, send_ussd, capture_screenshot,
+                     start_screen_record, stop_screen_record, input_text, tap,
+                     load_config, save_config, reset_config, log_action, show_logs,
+                     balance_cache, BALANCE_TTL, current_sim, send_transfer, LOG_FILE,
+                     scheduler, PRIORITY_VERIFICATION, PRIORITY_BULK)
 
 # ------------------------ PASSWORD ------------------------
 def set_password():
@@ -86,21 +42,6 @@ def verify_password(stored_pw):
         return False
     return True
 
-# ------------------------ LOGGING ------------------------
-def log_action(action):
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(LOG_FILE, "a") as f:
-        f.write(f"[{now}] {action}\n")
-
-def show_logs():
-    if not os.path.exists(LOG_FILE):
-        print("📂 No logs found.")
-        return
-    with open(LOG_FILE) as f:
-        logs = f.readlines()
-    print("\n📜 Logs:")
-    print("".join(logs))
-
 # ------------------------ TELECOM FEATURES ------------------------
 PROVIDERS = {
     "vodafone": {
@@ -125,17 +66,32 @@ PROVIDERS = {
     }
 }
 
-def send_ussd_transfer(number, amount, pin, provider):
+def send_ussd_transfer(number, amount, pin, provider, verified_later=False):
     code = PROVIDERS[provider]["transfer"].format(number=number, amount=amount, pin=pin)
     print(f"📤 Sending USSD: {code}")
-    send_ussd(code)
+    send_transfer(code, provider, verified_later=verified_later)
     log_action(f"Transfer: {amount} to {number} [{provider}]")
 
-def check_balance(provider):
+def check_balance(provider, max_age=None, sim=None):
+    config = load_config()
+    sim = current_sim(sim)
+    if max_age is None:
+        max_age = config.get("balance_ttl", BALANCE_TTL)
+    cached = balance_cache.get(provider, sim, max_age)
+    if cached:
+        age = int(time.time() - cached["at"])
+        print(f"💰 Balance: {cached['balance']:.2f} EGP (cached {age}s ago)")
+        return cached["balance"]
+
     code = PROVIDERS[provider]["balance"]
     print(f"📞 Checking balance using {code}")
     send_ussd(code)
     log_action(f"Checked balance [{provider}]")
+    balance = read_balance_from_screen()
+    if balance is not None:
+        balance_cache.put(provider, sim, balance)
+        print(f"💰 Balance: {balance:.2f} EGP")
+    return balance
 
 def reset_pin(provider, nid):
     code = PROVIDERS[provider]["reset_pin"].format(nid=nid)
@@ -143,6 +99,157 @@ def reset_pin(provider, nid):
     send_ussd(code)
     log_action(f"Reset PIN using NID [{provider}]")
 
+# ------------------------ OCR ------------------------
+OCR_LANG = "eng+ara"
+OCR_FRAME_DIR = "ocr_frames"
+OCR_SETTLE_SECONDS = 3  # time for the carrier's USSD reply to reach the screen
+
+# Commas are only ever thousands separators in carrier replies ("1,234.50 EGP").
+AMOUNT_PATTERN = r"(\d{1,3}(?:,\d{3})*(?:\.\d+)?|\d+(?:\.\d+)?)(?!\d|,\d)"
+BALANCE_PATTERNS = [
+    re.compile(AMOUNT_PATTERN + r"\s*(?:EGP|L\.?E|جنيه)", re.IGNORECASE),
+    re.compile(r"(?:balance|رصيد\w*)\D{0,20}" + AMOUNT_PATTERN, re.IGNORECASE),
+]
+
+TRANSFER_CONFIRMED = re.compile(r"success|completed|تم", re.IGNORECASE)
+
+def clean_ocr_text(text):
+    return re.sub(r'[^\dEGP\.\n]+', ' ', text)
+
+def parse_balance(text):
+    for pattern in BALANCE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return float(match.group(1).replace(",", ""))
+    return None
+
+_ocr_engine = None
+
+def _init_ocr_worker():
+    # Runs once in each pool process so tesseract bindings stay loaded.
+    global _ocr_engine
+    import pytesseract
+    from PIL import Image
+    _ocr_engine = (pytesseract, Image)
+
+def _ocr_frame(row_id, image_path):
+    pytesseract, Image = _ocr_engine
+    with Image.open(image_path) as img:
+        text = pytesseract.image_to_string(img, lang=OCR_LANG)
+    return row_id, clean_ocr_text(text), parse_balance(text), bool(TRANSFER_CONFIRMED.search(text))
+
+class OcrVerifier:
+    """Post-transfer verification stage backed by a process pool.
+
+    Captured frames are queued to worker processes and each result is handed
+    to ``on_result(row_id, text, balance, confirmed)`` as soon as it is ready, so rows
+    complete out of order and OCR never blocks USSD dispatch.
+    """
+
+    def __init__(self, workers=None, on_result=None):
+        self.pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=_init_ocr_worker)
+        self.on_result = on_result or record_verification
+        self._lock = threading.Lock()
+
+    def submit(self, row_id, image_path):
+        future = self.pool.submit(_ocr_frame, row_id, image_path)
+        future.add_done_callback(lambda f: self._done(row_id, f))
+        return future
+
+    def _done(self, row_id, future):
+        with self._lock:
+            try:
+                self.on_result(*future.result())
+            except Exception as e:
+                print(f"❌ OCR verification failed for row {row_id}:", e)
+                log_action(f"OCR verify row {row_id} failed: {e}")
+                # The money may still have gone out; report the row as unconfirmed.
+                self.on_result(row_id, "", None, False)
+
+    def close(self):
+        self.pool.shutdown(wait=True)
+
+def record_verification(row_id, text, balance, confirmed):
+    if balance is not None:
+        status = f"balance {balance:.2f} EGP"
+    else:
+        status = "confirmed, no balance shown" if confirmed else "not confirmed"
+    print(f"🧾 Row {row_id} verified: {status}")
+    log_action(f"OCR verify row {row_id}: {status}")
+
+def read_balance_from_screen():
+    try:
+        import pytesseract
+        from PIL import Image
+    except ImportError:
+        return None
+    time.sleep(OCR_SETTLE_SECONDS)
+    img = capture_screenshot()
+    try:
+        text = pytesseract.image_to_string(Image.open(img), lang=OCR_LANG)
+    except Exception as e:
+        print("❌ OCR failed:", e)
+        return None
+    return parse_balance(text)
+
+class BulkBalanceTracker:
+    """Applies out-of-order verification results to the balance cache.
+
+    Every row's outcome is kept. The cached value is always rebuilt as the
+    newest balance reading minus the amounts of confirmed rows after it, so
+    the order in which OCR results arrive does not matter. A reading from a
+    row at or before the current base reading is ignored, since that base
+    already includes it. Before any reading arrives, the base is the cache
+    entry that existed when the run started.
+
+    A row counts as pending from the moment it is dispatched until its
+    outcome arrives. While any row is pending, or any row after the base is
+    unconfirmed, the cache entry is invalidated rather than over-reporting.
+    """
+
+    def __init__(self, provider, sim):
+        self.provider = provider
+        self.sim = sim
+        self.amounts = {}
+        self.pending = set()
+        self.outcomes = {}  # row_id -> True (confirmed) / False (unconfirmed)
+        self._lock = threading.Lock()
+        start = balance_cache.get(provider, sim, max_age=float("inf"))
+        self.base = (0, start["balance"], start["at"]) if start else None
+
+    def dispatched(self, row_id):
+        # Called just before the transfer is sent.
+        with self._lock:
+            self.pending.add(row_id)
+            self._apply()
+
+    def __call__(self, row_id, text, balance, confirmed):
+        record_verification(row_id, text, balance, confirmed)
+        with self._lock:
+            self.pending.discard(row_id)
+            self.outcomes[row_id] = balance is not None or confirmed
+            if balance is not None and (self.base is None or row_id > self.base[0]):
+                self.base = (row_id, balance, time.time())
+            self._apply()
+
+    def finish(self):
+        # Rows that were sent but never produced a result leave the balance unknown.
+        with self._lock:
+            if self.pending:
+                balance_cache.invalidate(self.provider, self.sim)
+
+    def _apply(self):
+        if self.base is None or self.pending:
+            balance_cache.invalidate(self.provider, self.sim)
+            return
+        base_row, balance, at = self.base
+        later = [row_id for row_id in self.outcomes if row_id > base_row]
+        if not all(self.outcomes[row_id] for row_id in later):
+            balance_cache.invalidate(self.provider, self.sim)
+            return
+        balance -= sum(float(self.amounts[row_id]) for row_id in later)
+        balance_cache.put(self.provider, self.sim, round(balance, 2), at=at)
+
 # ------------------------ ADVANCED FEATURES ------------------------
 def get_balance_via_ocr():
     print("🔍 Capturing screen for OCR...")
@@ -150,21 +257,61 @@ def get_balance_via_ocr():
     try:
         import pytesseract
         from PIL import Image
-        text = pytesseract.image_to_string(Image.open(img), lang='eng+ara')
-        cleaned = re.sub(r'[^\dEGP\.\n]+', ' ', text)
-        print("📖 OCR Result:\n", cleaned)
+        text = pytesseract.image_to_string(Image.open(img), lang=OCR_LANG)
+        print("📖 OCR Result:\n", clean_ocr_text(text))
         log_action("OCR balance check")
     except Exception as e:
         print("❌ OCR failed:", e)
 
-def bulk_transfer(file, provider):
+def bulk_transfer(file, provider, verify=False, ocr_workers=None, wait=True):
     import csv
     with open(file) as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            send_ussd_transfer(row['number'], row['amount'], row['pin'], provider)
-    print("✅ Bulk transfer complete.")
-    log_action(f"Bulk transfer from {file} [{provider}]")
+        rows = list(csv.DictReader(f))
+    tracker = BulkBalanceTracker(provider, current_sim())
+    tracker.amounts = {row_id: row['amount'] for row_id, row in enumerate(rows, 1)}
+    verifier = OcrVerifier(ocr_workers, on_result=tracker) if verify else None
+    if verify:
+        os.makedirs(OCR_FRAME_DIR, exist_ok=True)
+
+    def run_row(row_id, row):
+        if verifier:
+            tracker.dispatched(row_id)
+        send_ussd_transfer(row['number'], row['amount'], row['pin'], provider,
+                           verified_later=bool(verifier))
+        if verifier:
+            time.sleep(OCR_SETTLE_SECONDS)
+            frame = capture_screenshot(os.path.join(OCR_FRAME_DIR, f"row-{row_id}.png"))
+            verifier.submit(row_id, frame)
+
+    # One job per row: anything interactive queued meanwhile runs at the next row boundary.
+    futures = [scheduler.submit(run_row, row_id, row, priority=PRIORITY_BULK)
+               for row_id, row in enumerate(rows, 1)]
+
+    def finish():
+        failed = 0
+        for row_id, future in enumerate(futures, 1):
+            try:
+                future.result()
+            except Exception as e:
+                failed += 1
+                print(f"❌ Row {row_id} failed:", e)
+                log_action(f"Bulk row {row_id} failed: {e}")
+        if verifier:
+            print("⏳ Waiting for OCR verification to finish...")
+            verifier.close()
+            tracker.finish()
+        print(f"✅ Bulk transfer complete ({len(rows) - failed}/{len(rows)} rows sent).")
+        log_action(f"Bulk transfer from {file} [{provider}]")
+        show_scheduler_stats()
+
+    if wait:
+        finish()
+    else:
+        print(f"📦 Queued {len(rows)} rows; menu actions will run between rows.")
+        threading.Thread(target=finish, name="bulk-finish").start()
+
+def show_scheduler_stats():
+    print(tabulate(scheduler.report(), headers=["Class", "Jobs", "Avg wait (s)", "Max wait (s)", "Run (s)"]))
 
 def simulate_mode():
     print("🧪 Running in simulation mode (no real USSD calls)...")
@@ -174,36 +321,270 @@ def simulate_mode():
     print("🔁 Simulated PIN reset request.")
     log_action("Simulated operations")
 
-def voice_interface():
+# ------------------------ VOICE COMMANDS ------------------------
+VOICE_MODEL_PATH = "vosk-model"
+VOICE_SAMPLE_RATE = 16000
+VOICE_CHUNK_FRAMES = 1600  # 100 ms of audio per recognizer step
+
+DIGIT_WORDS = {
+    "zero": 0, "oh": 0, "one": 1, "two": 2, "three": 3, "four": 4,
+    "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9
+}
+TEEN_WORDS = {
+    "ten": 10, "eleven": 11, "twelve": 12, "thirteen": 13, "fourteen": 14,
+    "fifteen": 15, "sixteen": 16, "seventeen": 17, "eighteen": 18, "nineteen": 19
+}
+TENS_WORDS = {
+    "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50,
+    "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90
+}
+SCALE_WORDS = {"hundred": 100, "thousand": 1000}
+
+# Everything the recognizer is allowed to hear; anything else decodes as [unk].
+VOICE_GRAMMAR = (["check balance", "transfer", "to"] + list(DIGIT_WORDS) + list(TEEN_WORDS)
+                 + list(TENS_WORDS) + list(SCALE_WORDS) + ["[unk]"])
+
+_voice_model = None
+_voice_recognizers = {}
+
+def load_voice_model(path=None):
+    # The offline model is loaded once per process and kept warm.
+    global _voice_model
+    if _voice_model is None:
+        from vosk import Model, SetLogLevel
+        SetLogLevel(-1)
+        _voice_model = Model(path or load_config().get("voice_model", VOICE_MODEL_PATH))
+    return _voice_model
+
+def voice_recognizer(sample_rate=VOICE_SAMPLE_RATE):
+    if sample_rate not in _voice_recognizers:
+        from vosk import KaldiRecognizer
+        _voice_recognizers[sample_rate] = KaldiRecognizer(load_voice_model(), sample_rate, json.dumps(VOICE_GRAMMAR))
+    return _voice_recognizers[sample_rate]
+
+def words_to_number(words):
+    total, current = 0, 0
+    for word in words:
+        if word.isdigit():
+            current += int(word)
+        elif word in DIGIT_WORDS:
+            current += DIGIT_WORDS[word]
+        elif word in TEEN_WORDS:
+            current += TEEN_WORDS[word]
+        elif word in TENS_WORDS:
+            current += TENS_WORDS[word]
+        elif word == "hundred":
+            current = (current or 1) * 100
+        elif word == "thousand":
+            total += (current or 1) * 1000
+            current = 0
+    return total + current
+
+def parse_voice_command(text):
+    words = text.lower().split()
+    if "balance" in words:
+        return ("balance",)
+    if "transfer" in words and "to" in words:
+        start, split = words.index("transfer"), words.index("to")
+        amount = words_to_number(words[start + 1:split])
+        number = "".join(w if w.isdigit() else str(DIGIT_WORDS[w])
+                         for w in words[split + 1:] if w.isdigit() or w in DIGIT_WORDS)
+        # Only a complete 11-digit mobile number; a partly heard one must not reach the PIN prompt.
+        if amount and re.fullmatch(r"01\d{9}", number):
+            return ("transfer", str(amount), number)
+    return None
+
+def iter_voice_phrases(frames, sample_rate=VOICE_SAMPLE_RATE):
+    recognizer = voice_recognizer(sample_rate)
+    # The recognizer is cached; drop anything left over from an interrupted session.
+    recognizer.Reset()
+    for data in frames:
+        if recognizer.AcceptWaveform(data):
+            text = json.loads(recognizer.Result()).get("text", "")
+            if text:
+                yield text
+    text = json.loads(recognizer.FinalResult()).get("text", "")
+    if text:
+        yield text
+
+def microphone_frames(sample_rate=VOICE_SAMPLE_RATE):
+    import pyaudio
+    audio = pyaudio.PyAudio()
+    stream = audio.open(format=pyaudio.paInt16, channels=1, rate=sample_rate,
+                        input=True, frames_per_buffer=VOICE_CHUNK_FRAMES)
+    try:
+        while True:
+            yield stream.read(VOICE_CHUNK_FRAMES, exception_on_overflow=False)
+    finally:
+        stream.stop_stream()
+        stream.close()
+        audio.terminate()
+
+def wav_frames(wf):
+    while True:
+        data = wf.readframes(VOICE_CHUNK_FRAMES)
+        if not data:
+            return
+        yield data
+
+def recognize_wav(path):
+    with wave.open(path, "rb") as wf:
+        if wf.getnchannels() != 1 or wf.getsampwidth() != 2:
+            raise ValueError(f"{path}: expected mono 16-bit PCM WAV")
+        phrases = list(iter_voice_phrases(wav_frames(wf), wf.getframerate()))
+    return [cmd for cmd in map(parse_voice_command, phrases) if cmd]
+
+def run_voice_command(command, provider):
+    if command[0] == "balance":
+        scheduler.run(check_balance, provider)
+    elif command[0] == "transfer":
+        _, amount, number = command
+        print(f"🗣️ Heard: transfer {amount} EGP to {number}")
+        confirm = input(f"Confirm transfer of {amount} EGP to {number}? (y/n): ").lower()
+        if confirm != 'y':
+            print("❌ Transfer canceled.")
+            return
+        pin = getpass.getpass("🔐 Enter PIN: ")
+        scheduler.run(send_ussd_transfer, number, amount, pin, provider)
+
+def voice_interface(wav_file=None):
+    provider = load_config().get("provider", "vodafone")
     try:
-        import speech_recognition as sr
-        recognizer = sr.Recognizer()
-        mic = sr.Microphone()
-
-        print("🎙️ Say a command (e.g., 'check balance', 'transfer 50 to 01012345678')...")
-
-        with mic as source:
-            recognizer.adjust_for_ambient_noise(source)
-            print("🔊 Listening...")
-            audio = recognizer.listen(source)
-
-        command = recognizer.recognize_google(audio)
-        print(f"🗣️ You said: {command}")
-
-        if "check balance" in command:
-            check_balance("vodafone")
-        elif "transfer" in command:
-            words = command.split()
-            amount = next(word for word in words if word.isdigit())
-            number = next(word for word in words if word.startswith("01"))
-            pin = input("🔐 Enter PIN: ")
-            send_ussd_transfer(number, amount, pin, "vodafone")
-        else:
-            print("🤷 Unknown voice command.")
+        if wav_file:
+            for command in recognize_wav(wav_file):
+                run_voice_command(command, provider)
+            return
 
+        load_voice_model()
+        print("🎙️ Voice mode on. Say 'check balance' or 'transfer 50 to 01012345678' (Ctrl+C to stop)...")
+        for text in iter_voice_phrases(microphone_frames()):
+            print(f"🗣️ You said: {text}")
+            command = parse_voice_command(text)
+            if command:
+                run_voice_command(command, provider)
+            else:
+                print("🤷 Unknown voice command.")
+    except KeyboardInterrupt:
+        print("\n🛑 Voice mode stopped.")
     except Exception as e:
         print("❌ Voice recognition failed:", e)
 
+# ------------------------ PROFILING ------------------------
+PROFILE_SAMPLE_INTERVAL = 0.005
+PROFILE_TOP_N = 40
+
+class StackSampler:
+    """Samples every thread's stack on a timer for a collapsed-stack file.
+
+    Each line of the output is ``thread;outer;...;inner count``, which
+    flamegraph.pl and speedscope read directly.
+    """
+
+    def __init__(self, interval=PROFILE_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.counts = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                self.counts[";".join(reversed(stack))] += 1
+
+class JobProfiles:
+    """Scheduler hook that profiles jobs on the device worker threads."""
+
+    def __init__(self):
+        self.profiles = []
+        self._lock = threading.Lock()
+
+    def __call__(self, fn, args, kwargs):
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python 3.12+: only one profiler may be active and it already sees every thread.
+            return fn(*args, **kwargs)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profiler.disable()
+            with self._lock:
+                self.profiles.append(profiler)
+
+def command_name(args):
+    for name in ("set_password", "reset_config", "logs", "simulate", "voice", "voice_wav",
+                 "balance", "ocr", "bulk", "transfer", "reset_pin"):
+        if getattr(args, name):
+            return name.split("_wav")[0]
+    return "menu"
+
+def run_profiled(fn, name):
+    log_dir = os.path.dirname(os.path.abspath(LOG_FILE))
+    base = os.path.join(log_dir, f"profile-{name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}")
+    profiler = cProfile.Profile()
+    job_profiles = JobProfiles()
+    sampler = StackSampler()
+
+    scheduler.job_hook = job_profiles
+    tracemalloc.start(25)
+    sampler.start()
+    profiler.enable()
+    try:
+        return fn()
+    finally:
+        profiler.disable()
+        sampler.stop()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        scheduler.job_hook = None
+
+        profiler.dump_stats(base + ".prof")
+        with open(base + ".hotspots.txt", "w") as f:
+            stats = pstats.Stats(profiler, stream=f)
+            for extra in job_profiles.profiles:
+                stats.add(extra)
+            stats.sort_stats("cumulative").print_stats(PROFILE_TOP_N)
+            stats.sort_stats("tottime").print_stats(PROFILE_TOP_N)
+
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ])
+        with open(base + ".alloc.txt", "w") as f:
+            f.write(f"Current: {current / 1024:.1f} KiB, peak: {peak / 1024:.1f} KiB\n\n")
+            for stat in snapshot.statistics("lineno")[:PROFILE_TOP_N]:
+                f.write(f"{stat}\n")
+            f.write("\nTop allocation tracebacks:\n")
+            for stat in snapshot.statistics("traceback")[:5]:
+                f.write(f"\n{stat.count} blocks, {stat.size / 1024:.1f} KiB\n")
+                f.write("\n".join(stat.traceback.format()) + "\n")
+
+        with open(base + ".collapsed.txt", "w") as f:
+            for stack, count in sorted(sampler.counts.items()):
+                f.write(f"{stack} {count}\n")
+        print(f"📊 Profile reports written to {base}.*")
+
 # ------------------------ INTERACTIVE CLI ------------------------
 def show_interactive_menu():
     options = [
@@ -218,8 +599,8 @@ def show_interactive_menu():
         "Reset Config",
         "Exit"
     ]
-    config = load_config()
     while True:
+        config = load_config()
         print("\n🤖 ADB PowerTool Menu")
         for i, opt in enumerate(options, 1):
             print(f"[{i}] {opt}")
@@ -230,22 +611,22 @@ def show_interactive_menu():
                 amount = input("💸 Amount: ")
                 pin = input("🔐 PIN: ")
                 provider = config.get("provider", "vodafone")
-                send_ussd_transfer(number, amount, pin, provider)
+                scheduler.run(send_ussd_transfer, number, amount, pin, provider)
             elif choice == 2:
                 provider = config.get("provider", "vodafone")
-                check_balance(provider)
+                scheduler.run(check_balance, provider)
             elif choice == 3:
-                get_balance_via_ocr()
+                scheduler.run(get_balance_via_ocr, priority=PRIORITY_VERIFICATION)
             elif choice == 4:
                 voice_interface()
             elif choice == 5:
                 file = input("📄 CSV File Path: ")
                 provider = config.get("provider", "vodafone")
-                bulk_transfer(file, provider)
+                bulk_transfer(file, provider, wait=False)
             elif choice == 6:
                 provider = config.get("provider", "vodafone")
                 nid = input("🆔 National ID: ")
-                reset_pin(provider, nid)
+                scheduler.run(reset_pin, provider, nid)
             elif choice == 7:
                 new_provider = input("🔁 Enter new default provider: ").lower()
                 if new_provider in PROVIDERS:
@@ -259,6 +640,7 @@ def show_interactive_menu():
             elif choice == 9:
                 reset_config()
             elif choice == 10:
+                show_scheduler_stats()
                 print("👋 Exiting...")
                 break
             else:
@@ -275,12 +657,20 @@ def parse_args():
     parser.add_argument("--simulate", action="store_true")
     parser.add_argument("--lang", choices=["ar", "en"])
     parser.add_argument("--voice", action="store_true")
+    parser.add_argument("--voice-wav", metavar="FILE", help="Run voice commands from a mono 16-bit WAV file")
     parser.add_argument("--balance", action="store_true")
+    parser.add_argument("--max-age", type=int, metavar="SECONDS",
+                        help="Answer --balance from cache if the last reading is this recent (0 forces a dial)")
+    parser.add_argument("--sim", help="SIM slot/ID the balance cache is keyed on (default: config 'sim' or 1)")
     parser.add_argument("--ocr", action="store_true")
     parser.add_argument("--bulk")
+    parser.add_argument("--verify", action="store_true", help="OCR-verify each bulk row after dispatch")
+    parser.add_argument("--ocr-workers", type=int, help="OCR worker processes for --verify (default: CPU count)")
     parser.add_argument("--provider", choices=PROVIDERS.keys())
     parser.add_argument("--transfer", nargs=3, metavar=("number", "amount", "pin"))
     parser.add_argument("--reset-pin", nargs=2, metavar=("provider", "nid"))
+    parser.add_argument("--profile", action="store_true",
+                        help="Run the command under cProfile/tracemalloc and write reports next to the logs")
     return parser.parse_args()
 
 # ------------------------ MAIN ------------------------
@@ -305,6 +695,12 @@ def main():
         if not verify_password(config["password"]):
             return
 
+    if args.profile:
+        run_profiled(lambda: run_command(args, config), command_name(args))
+    else:
+        run_command(args, config)
+
+def run_command(args, config):
     if args.set_password:
         set_password()
     elif args.reset_config:
@@ -313,14 +709,15 @@ def main():
         show_logs()
     elif args.simulate:
         simulate_mode()
-    elif args.voice:
-        voice_interface()
+    elif args.voice or args.voice_wav:
+        voice_interface(args.voice_wav)
     elif args.balance:
-        check_balance(args.provider or config.get("provider", "vodafone"))
+        check_balance(args.provider or config.get("provider", "vodafone"), max_age=args.max_age, sim=args.sim)
     elif args.ocr:
         get_balance_via_ocr()
     elif args.bulk:
-        bulk_transfer(args.bulk, args.provider or config.get("provider", "vodafone"))
+        bulk_transfer(args.bulk, args.provider or config.get("provider", "vodafone"),
+                      verify=args.verify, ocr_workers=args.ocr_workers)
     elif args.transfer:
         num, amt, pin = args.transfer
         send_ussd_transfer(num, amt, pin, args.provider or config.get("provider", "vodafone"))
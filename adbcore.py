@@ -0,0 +1,414 @@
+import os
+import json
+import itertools
+import queue
+import shlex
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime
+
+CONFIG_FILE = "config.json"
+LOG_FILE = "logs.txt"
+
+ADB_TCP_PORT = 5555
+ADB_TIMEOUT = 30
+KEEPALIVE_INTERVAL = 15
+
+# ------------------------ TRANSPORT ------------------------
+class AdbTransport:
+    """One adb transport shared by every tool.
+
+    Commands are passed to adb as argv lists (no intermediate shell) and are
+    pinned to a single device serial once one is known. For TCP/IP devices a
+    keepalive thread polls the connection and reconnects when it drops.
+    """
+
+    def __init__(self, serial=None):
+        self.serial = serial
+        self.address = None
+        self._keepalive = None
+        self._stop = threading.Event()
+        self._reconnect_lock = threading.Lock()
+        self._record = None
+
+    def _argv(self, args):
+        base = ["adb"]
+        if self.serial:
+            base += ["-s", self.serial]
+        return base + list(args)
+
+    def run(self, *args, timeout=ADB_TIMEOUT):
+        try:
+            result = subprocess.run(self._argv(args), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                    timeout=timeout, check=True)
+            return result.stdout.decode(errors="replace").strip()
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+            return ""
+
+    def shell(self, command, timeout=ADB_TIMEOUT):
+        return self.run("shell", command, timeout=timeout)
+
+    def devices(self):
+        lines = subprocess_output(["adb", "devices"]).splitlines()[1:]
+        return [line.split("\t")[0] for line in lines if line.endswith("\tdevice")]
+
+    def is_online(self):
+        if self.serial:
+            return self.run("get-state", timeout=5) == "device"
+        return bool(self.devices())
+
+    # ---- TCP/IP ----
+    def connect(self, ip, port=ADB_TCP_PORT, keepalive=True):
+        self.address = ip if ":" in ip else f"{ip}:{port}"
+        self.serial = self.address
+        ok = self.reconnect()
+        if keepalive:
+            self.start_keepalive()
+        return ok
+
+    def reconnect(self):
+        if not self.address:
+            return False
+        with self._reconnect_lock:
+            output = subprocess_output(["adb", "connect", self.address], timeout=10)
+            return "connected to" in output
+
+    def start_keepalive(self, interval=KEEPALIVE_INTERVAL):
+        if self._keepalive and self._keepalive.is_alive():
+            return
+        self._stop.clear()
+
+        def loop():
+            while not self._stop.wait(interval):
+                if not self.is_online():
+                    print(f"\n[ADB] Lost {self.address}, reconnecting...")
+                    self.reconnect()
+
+        self._keepalive = threading.Thread(target=loop, name="adb-keepalive", daemon=True)
+        self._keepalive.start()
+
+    def stop_keepalive(self):
+        self._stop.set()
+
+    # ---- Screen recording ----
+    def start_screen_record(self, remote="/sdcard/record.mp4"):
+        self._record = subprocess.Popen(self._argv(["shell", "screenrecord", remote]),
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def stop_screen_record(self, remote="/sdcard/record.mp4", local="record.mp4"):
+        self.shell("killall -9 screenrecord")
+        if self._record:
+            self._record.wait(timeout=5)
+            self._record = None
+        self.run("pull", remote, local)
+
+
+def subprocess_output(argv, timeout=ADB_TIMEOUT):
+    try:
+        result = subprocess.run(argv, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=timeout)
+        return result.stdout.decode(errors="replace").strip()
+    except (subprocess.TimeoutExpired, OSError):
+        return ""
+
+
+transport = AdbTransport()
+
+# ------------------------ ADB FUNCTIONS ------------------------
+def adb(command):
+    return transport.run(*shlex.split(command))
+
+def connect_adb(ip, port=ADB_TCP_PORT):
+    print(f"[ADB] Connecting to {ip}...")
+    if not transport.connect(ip, port):
+        print(f"[ADB] Could not connect to {ip}, will keep retrying in the background.")
+
+def check_adb_connection():
+    while not transport.is_online():
+        print("\nTrying to reconnect ADB...")
+        transport.reconnect()
+        time.sleep(2)
+    return True
+
+def send_ussd(code):
+    transport.shell(f"am start -a android.intent.action.CALL -d tel:{code.replace('#', '%23')}")
+
+def capture_screenshot(local="screen.png"):
+    transport.shell("screencap -p /sdcard/screen.png")
+    transport.run("pull", "/sdcard/screen.png", local)
+    return local
+
+def start_screen_record():
+    transport.start_screen_record()
+
+def stop_screen_record():
+    transport.stop_screen_record()
+
+def input_text(text):
+    transport.shell(f"input text '{text}'")
+
+def tap(x, y):
+    transport.shell(f"input tap {x} {y}")
+
+# ------------------------ JOB SCHEDULER ------------------------
+PRIORITY_INTERACTIVE = 0
+PRIORITY_VERIFICATION = 1
+PRIORITY_BULK = 2
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_VERIFICATION: "verification",
+    PRIORITY_BULK: "bulk",
+}
+
+class JobScheduler:
+    """Serialises device work through one priority queue per device.
+
+    Each device gets a single worker thread, so two USSD sessions never
+    overlap. Jobs are whole units of work (one bulk row, one balance check);
+    a queued interactive job therefore runs at the next row boundary instead
+    of after the whole batch. Queueing delay and run time are accounted per
+    priority class.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queues = {}
+        self._seq = itertools.count()
+        self.job_hook = None  # optional hook(fn, args, kwargs) wrapped around every job
+        self.stats = {name: {"jobs": 0, "wait": 0.0, "max_wait": 0.0, "run": 0.0}
+                      for name in PRIORITY_NAMES.values()}
+
+    def _queue_for(self, device):
+        with self._lock:
+            if device not in self._queues:
+                jobs = queue.PriorityQueue()
+                self._queues[device] = jobs
+                threading.Thread(target=self._worker, args=(jobs,), name=f"adb-jobs-{device}", daemon=True).start()
+            return self._queues[device]
+
+    def submit(self, fn, *args, priority=PRIORITY_INTERACTIVE, device=None, **kwargs):
+        future = Future()
+        device = device or transport.serial or "default"
+        self._queue_for(device).put((priority, next(self._seq), time.monotonic(), future, fn, args, kwargs))
+        return future
+
+    def run(self, fn, *args, priority=PRIORITY_INTERACTIVE, **kwargs):
+        return self.submit(fn, *args, priority=priority, **kwargs).result()
+
+    def _worker(self, jobs):
+        while True:
+            priority, _, queued_at, future, fn, args, kwargs = jobs.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            started = time.monotonic()
+            try:
+                if self.job_hook:
+                    future.set_result(self.job_hook(fn, args, kwargs))
+                else:
+                    future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            self._account(priority, started - queued_at, time.monotonic() - started)
+
+    def _account(self, priority, wait, run):
+        with self._lock:
+            stats = self.stats[PRIORITY_NAMES[priority]]
+            stats["jobs"] += 1
+            stats["wait"] += wait
+            stats["max_wait"] = max(stats["max_wait"], wait)
+            stats["run"] += run
+
+    def report(self):
+        with self._lock:
+            return [[name, s["jobs"], f"{s['wait'] / s['jobs']:.3f}" if s["jobs"] else "-",
+                     f"{s['max_wait']:.3f}", f"{s['run']:.1f}"]
+                    for name, s in self.stats.items()]
+
+
+scheduler = JobScheduler()
+
+# ------------------------ CONFIG ------------------------
+# Shared config.json schema (version 1), used by every tool:
+#   version     - schema version, written on every save
+#   provider    - default carrier key (vodafone/etisalat/orange/we)
+#   language    - "ar" or "en"
+#   password    - CLI unlock password
+#   ip, pin     - ADB Wi-Fi address and wallet PIN used by minn.py
+#   voice_model - path to the offline Vosk model (default "vosk-model")
+#   sim         - SIM slot/ID the balance cache is keyed on (default "1")
+#   balance_ttl - seconds a cached balance is served without dialing (default 300)
+# Files written before versioning (no "version" key) are read as version 0.
+CONFIG_VERSION = 1
+
+def file_stamp(path):
+    # (mtime, size) identifies a version of the file well enough to skip re-parsing it.
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def atomic_write_json(path, data):
+    # Write to a sibling temp file and rename it over the target.
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=directory)
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def migrate_config(config):
+    if config.get("version", 0) < CONFIG_VERSION:
+        config["version"] = CONFIG_VERSION
+    return config
+
+class ConfigStore:
+    """In-process cache of config.json.
+
+    The parsed file is kept in memory and only re-read when its mtime or size
+    changes, so hot loops pay for one stat() instead of an open and a parse.
+    Saves go to a temp file in the same directory and are renamed over the
+    original, so a crash never leaves a truncated config behind.
+    """
+
+    def __init__(self, path=CONFIG_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._data = {}
+
+    def load(self):
+        stamp = file_stamp(self.path)
+        with self._lock:
+            if stamp != self._stamp:
+                if stamp is None:
+                    self._data = {}
+                else:
+                    with open(self.path) as f:
+                        self._data = migrate_config(json.load(f))
+                self._stamp = stamp
+            return dict(self._data)
+
+    def save(self, config):
+        config = migrate_config(dict(config))
+        with self._lock:
+            atomic_write_json(self.path, config)
+            self._data = config
+            self._stamp = file_stamp(self.path)
+
+    def reset(self):
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            self._data = {}
+            self._stamp = None
+
+
+config_store = ConfigStore()
+
+def load_config():
+    return config_store.load()
+
+def save_config(config):
+    config_store.save(config)
+
+def reset_config():
+    config_store.reset()
+    print("✅ Config reset.")
+
+# ------------------------ BALANCE CACHE ------------------------
+BALANCE_CACHE_FILE = "balance_cache.json"
+BALANCE_TTL = 300
+
+class BalanceCache:
+    """Last known wallet balance per provider and SIM.
+
+    Entries are ``{"balance": float, "at": epoch seconds}`` and are mirrored
+    to disk so a fresh process can still answer from a recent reading. Like
+    ConfigStore, the file is re-read whenever its mtime or size changes, so
+    updates and invalidations from other tools are picked up before every
+    read and before every write.
+    """
+
+    def __init__(self, path=BALANCE_CACHE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._stamp = None
+
+    @staticmethod
+    def _key(provider, sim):
+        return f"{provider}:{sim}"
+
+    def _load(self):
+        stamp = file_stamp(self.path)
+        if stamp != self._stamp:
+            try:
+                with open(self.path) as f:
+                    self._entries = json.load(f)
+            except (FileNotFoundError, ValueError):
+                self._entries = {}
+            self._stamp = stamp
+        return self._entries
+
+    def _persist(self):
+        atomic_write_json(self.path, self._entries)
+        self._stamp = file_stamp(self.path)
+
+    def get(self, provider, sim, max_age=BALANCE_TTL):
+        with self._lock:
+            entry = self._load().get(self._key(provider, sim))
+        if entry and time.time() - entry["at"] <= max_age:
+            return entry
+        return None
+
+    def put(self, provider, sim, balance, at=None):
+        # Pass ``at`` when the value is derived from an older reading so it ages from that reading.
+        with self._lock:
+            self._load()[self._key(provider, sim)] = {"balance": balance, "at": at or time.time()}
+            self._persist()
+
+    def invalidate(self, provider, sim):
+        with self._lock:
+            if self._load().pop(self._key(provider, sim), None) is not None:
+                self._persist()
+
+
+balance_cache = BalanceCache()
+
+def current_sim(sim=None):
+    return str(sim or load_config().get("sim", "1"))
+
+def send_transfer(code, provider, sim=None, verified_later=False):
+    # Every tool's transfers go through here so the shared balance cache never outlives one.
+    if not verified_later:
+        balance_cache.invalidate(provider, current_sim(sim))
+    send_ussd(code)
+
+# ------------------------ LOGGING ------------------------
+def log_action(action, target=None, amount=None, log_file=LOG_FILE):
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    entry = f"[{now}] {action}"
+    if target:
+        entry += f" | Target: {target}"
+    if amount:
+        entry += f" | Amount: {amount} EGP"
+    with open(log_file, "a") as f:
+        f.write(entry + "\n")
+
+def show_logs(log_file=LOG_FILE):
+    if not os.path.exists(log_file):
+        print("📂 No logs found.")
+        return
+    with open(log_file) as f:
+        logs = f.readlines()
+    print("\n📜 Logs:")
+    print("".join(logs))
@@ -1,41 +1,23 @@
-import os
-import json
 import getpass
-from datetime import datetime
 
-CONFIG_PATH = "config.json"
+import adbcore
+from adbcore import connect_adb, send_ussd, send_transfer
+
 LOG_PATH = "cash_log.txt"
 
 def load_config():
-    if os.path.exists(CONFIG_PATH):
-        with open(CONFIG_PATH, "r") as f:
-            return json.load(f)
-    else:
-        ip = input("Enter your phone's ADB IP address (e.g. 192.168.1.7): ").strip()
-        pin = getpass.getpass("Enter your Vodafone Cash PIN: ").strip()
-        config = {"ip": ip, "pin": pin}
-        with open(CONFIG_PATH, "w") as f:
-            json.dump(config, f)
+    config = adbcore.load_config()
+    if config.get("ip") and config.get("pin"):
         return config
-
-def connect_adb(ip):
-    print(f"[ADB] Connecting to {ip}...")
-    os.system(f"adb connect {ip}")
-
-def send_ussd(code):
-    safe_code = code.replace("#", "%23")
-    command = f'adb shell am start -a android.intent.action.CALL -d tel:{safe_code}'
-    os.system(command)
+    if not config.get("ip"):
+        config["ip"] = input("Enter your phone's ADB IP address (e.g. 192.168.1.7): ").strip()
+    if not config.get("pin"):
+        config["pin"] = getpass.getpass("Enter your Vodafone Cash PIN: ").strip()
+    adbcore.save_config(config)
+    return config
 
 def log_action(action, target=None, amount=None):
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(LOG_PATH, "a") as f:
-        log_entry = f"[{now}] {action}"
-        if target:
-            log_entry += f" | Target: {target}"
-        if amount:
-            log_entry += f" | Amount: {amount} EGP"
-        f.write(log_entry + "\n")
+    adbcore.log_action(action, target, amount, log_file=LOG_PATH)
 
 def transfer_money(pin):
     phone = input("Recipient phone number (e.g. 01012345678): ").strip()
@@ -43,7 +25,7 @@ def transfer_money(pin):
     confirm = input(f"Confirm transfer of {amount} EGP to {phone}? (y/n): ").lower()
     if confirm == 'y':
         ussd = f"*9*7*{phone}*{amount}*{pin}#"
-        send_ussd(ussd)
+        send_transfer(ussd, "vodafone")
         log_action("Transfer", phone, amount)
         print("[✔] Transfer request sent.")
     else:
@@ -0,0 +1,16 @@
+import pytest
+
+from adb_powertool_pro import parse_balance
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Your balance is 120.75 EGP", 120.75),
+    ("Your balance is 1,234.50 EGP", 1234.5),
+    ("Balance: 1234.50", 1234.5),
+    ("Balance: 12,345,678", 12345678.0),
+    ("رصيدك الحالي 55.5", 55.5),
+    ("تم التحويل. رصيدك 2,500 جنيه", 2500.0),
+    ("No amount here", None),
+])
+def test_parse_balance(text, expected):
+    assert parse_balance(text) == expected
@@ -0,0 +1,28 @@
+import pytest
+
+from adb_powertool_pro import parse_voice_command, words_to_number
+
+
+@pytest.mark.parametrize("words, expected", [
+    ("fifty", 50),
+    ("two hundred fifty", 250),
+    ("one thousand five hundred", 1500),
+    ("twelve thousand", 12000),
+    ("3 hundred", 300),
+])
+def test_words_to_number(words, expected):
+    assert words_to_number(words.split()) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("check balance", ("balance",)),
+    ("transfer one hundred to zero one zero one two three four five six seven eight",
+     ("transfer", "100", "01012345678")),
+    ("transfer two hundred fifty to 0 1 1 1 2 3 4 5 6 7 8", ("transfer", "250", "01112345678")),
+    ("transfer one hundred to zero one zero one two three", None),
+    ("transfer to zero one zero one two three four five six seven eight", None),
+    ("transfer one hundred", None),
+    ("hello there", None),
+])
+def test_parse_voice_command(text, expected):
+    assert parse_voice_command(text) == expected